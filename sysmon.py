@@ -5,12 +5,14 @@ Combines htop, nvidia-smi, and network monitoring into one real-time dashboard
 """
 
 import asyncio
+import heapq
+import math
 import time
 import platform
 import subprocess
 import sys
-from datetime import datetime
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import psutil
 from rich.console import Console
@@ -36,161 +38,339 @@ try:
 except ImportError:
     NVIDIA_AVAILABLE = False
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Seconds between dashboard refreshes
+REFRESH_INTERVAL = 1.0
+
+_ASCII_HEADER = """
+███████╗██╗   ██╗███████╗████████╗███████╗███╗   ███╗     ██████╗ ██╗   ██╗███████╗██████╗ ██╗   ██╗██╗███████╗██╗    ██╗
+██╔════╝╚██╗ ██╔╝██╔════╝╚══██╔══╝██╔════╝████╗ ████║    ██╔═══██╗██║   ██║██╔════╝██╔══██╗██║   ██║██║██╔════╝██║    ██║
+███████╗ ╚████╔╝ ███████╗   ██║   █████╗  ██╔████╔██║    ██║   ██║██║   ██║█████╗  ██████╔╝██║   ██║██║█████╗  ██║ █╗ ██║
+╚════██║  ╚██╔╝  ╚════██║   ██║   ██╔══╝  ██║╚██╔╝██║    ██║   ██║╚██╗ ██╔╝██╔══╝  ██╔══██╗╚██╗ ██╔╝██║██╔══╝  ██║███╗██║
+███████║   ██║   ███████║   ██║   ███████╗██║ ╚═╝ ██║    ╚██████╔╝ ╚████╔╝ ███████╗██║  ██║ ╚████╔╝ ██║███████╗╚███╔███╔╝
+╚══════╝   ╚═╝   ╚══════╝   ╚═╝   ╚══════╝╚═╝     ╚═╝     ╚═════╝   ╚═══╝  ╚══════╝╚═╝  ╚═╝  ╚═══╝  ╚═╝╚══════╝ ╚══╝╚══╝
+"""
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Pseudo/virtual filesystems that aren't worth a disk_usage() call
+_SKIP_FS = {
+    "squashfs",
+    "tmpfs",
+    "devtmpfs",
+    "overlay",
+    "proc",
+    "sysfs",
+    "cgroup",
+    "cgroup2",
+    "autofs",
+    "nsfs",
+}
+
+# Pre-bound formatters for the fixed-shape cells rendered every frame
+_FMT_PCT = "{:5.1f}%".format
+_FMT_MHZ = "{:.0f} MHz".format
+_FMT_COMMA = "{:,}".format
+
+# Every possible 20-cell usage bar, indexed by filled cells (one per 5%)
+_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+# Alert colors indexed by how many thresholds a value exceeds
+_LEVEL_COLORS = ("green", "yellow", "red")
+
+
+def _make_bar_lut(warn: int, crit: int) -> Tuple[Tuple[str, ...], ...]:
+    """Colored bar markup indexed by [_ceil_index(pct)][filled cells]"""
+    # Only 3 x 21 distinct strings; each percentage points at its color's row
+    by_level = tuple(
+        tuple(f"[{color}]{bar}[/]" for bar in _BARS) for color in _LEVEL_COLORS
+    )
+    return tuple(by_level[(i > warn) + (i > crit)] for i in range(101))
+
+
+def _lut_index(percent: float) -> int:
+    """Clamp a percentage to an index into the 0-100 lookup tables"""
+    return min(100, max(0, int(percent)))
+
+
+def _ceil_index(percent: float) -> int:
+    """Like _lut_index() but rounding up, for picking alert colors"""
+    # For whole-number thresholds ceil(p) > t is exactly p > t
+    return min(100, max(0, math.ceil(percent)))
+
+
+def _bar_markup(lut: Tuple[Tuple[str, ...], ...], percent: float) -> str:
+    """Look up the colored bar for a percentage in a _make_bar_lut() table"""
+    return lut[_ceil_index(percent)][_lut_index(percent) // 5]
+
+
+# Ready-made "[color]bar[/]" markup per metric, see _bar_markup()
+_CPU_BARS = _make_bar_lut(60, 80)
+_MEM_BARS = _make_bar_lut(60, 80)
+_SWAP_BARS = _make_bar_lut(20, 50)
+_DISK_BARS = _make_bar_lut(75, 90)
+
+# Per-process "%.1f" cell templates; low usage is white rather than green
+_PROC_COLORS = ("white", "yellow", "red")
+_PROC_CPU_CELLS = tuple(
+    f"[{_PROC_COLORS[(i > 20) + (i > 50)]}]%.1f[/]" for i in range(101)
+)
+_PROC_MEM_CELLS = tuple(
+    f"[{_PROC_COLORS[(i > 10) + (i > 20)]}]%.1f[/]" for i in range(101)
+)
+
+
+def _fmt_proc_row(proc: Dict[str, Any]) -> Tuple[str, str, str, str, str]:
+    """Format one process-table row from a process info dict"""
+    cpu = proc["cpu_percent"] or 0.0
+    mem = proc["memory_percent"] or 0.0
+    return (
+        str(proc["pid"]),
+        (proc["name"] or "N/A")[:20],
+        _PROC_CPU_CELLS[_ceil_index(cpu)] % cpu,
+        _PROC_MEM_CELLS[_ceil_index(mem)] % mem,
+        (proc["status"] or "N/A")[:10],
+    )
+
+
+@dataclass
+class Snapshot:
+    """Metrics from one collection pass, rendered by the _render_* methods"""
+
+    users: List[Any]
+    cpu_percent: float
+    cpu_freq: Optional[Any]
+    memory: Any
+    swap: Any
+    gpus: List[Dict[str, Any]]
+    gpu_error: Optional[str]
+    net_io: Any
+    upload_speed: int
+    download_speed: int
+    active_interfaces: List[str]
+    processes: List[Dict[str, Any]]
+    disks: List[Tuple[str, Any]]
+
 
 class SystemMonitor:
     def __init__(self):
         self.console = Console()
         self.start_time = time.time()
         self.network_stats_prev = psutil.net_io_counters()
-        self.network_update_time = time.time()
+        self.network_update_ns = time.monotonic_ns()
+
+        # Values that never change while we're running
+        self.cpu_count = psutil.cpu_count()
+        self.system_str = f"{platform.system()} {platform.machine()}"
+        self.python_version = platform.python_version()
+
+        # (timestamp, value) pairs for slow-changing psutil calls, see _cached()
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+
+        # Prime the system-wide CPU baseline so cpu_percent(interval=None)
+        # returns a real value on the first frame instead of 0.0
+        psutil.cpu_percent(interval=None)
+
+        # process_iter() hands back the same Process objects across calls
+        # (replacing them if a pid gets reused), so priming cpu_percent()
+        # here gives the first frame a previous sample to diff against
+        for proc in psutil.process_iter():
+            try:
+                proc.cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        # Static header/footer, built once rather than every frame
+        self._header_panel = Align.center(
+            Text(_ASCII_HEADER, style="bold bright_green")
+        )
+        self._footer_panel = Align.center(
+            Text(
+                "🚀 System Overview - Press Ctrl+C to exit 🚀",
+                style="bold bright_green",
+            )
+        )
+
+        # Wall-clock second the "Time" row was last formatted for
+        self._clock_second = -1
+        self._clock_str = ""
 
         # Initialize NVIDIA if available
+        self._gpu_handles: List[Any] = []
+        self._gpu_names: List[str] = []
+        self._gpu_power_limits: List[Optional[int]] = []
+        # Error from a GPU that couldn't be set up, shown in the GPU panel
+        self._gpu_init_error: Optional[str] = None
         if NVIDIA_AVAILABLE:
             try:
                 pynvml.nvmlInit()
                 self.gpu_count = pynvml.nvmlDeviceGetCount()
+                self._init_gpus()
             except Exception:
                 self.gpu_count = 0
+                self._gpu_handles.clear()
+                self._gpu_names.clear()
+                self._gpu_power_limits.clear()
         else:
             self.gpu_count = 0
 
-    def get_ascii_header(self) -> Text:
-        """Generate cool ASCII header"""
-        header = """
-███████╗██╗   ██╗███████╗████████╗███████╗███╗   ███╗     ██████╗ ██╗   ██╗███████╗██████╗ ██╗   ██╗██╗███████╗██╗    ██╗
-██╔════╝╚██╗ ██╔╝██╔════╝╚══██╔══╝██╔════╝████╗ ████║    ██╔═══██╗██║   ██║██╔════╝██╔══██╗██║   ██║██║██╔════╝██║    ██║
-███████╗ ╚████╔╝ ███████╗   ██║   █████╗  ██╔████╔██║    ██║   ██║██║   ██║█████╗  ██████╔╝██║   ██║██║█████╗  ██║ █╗ ██║
-╚════██║  ╚██╔╝  ╚════██║   ██║   ██╔══╝  ██║╚██╔╝██║    ██║   ██║╚██╗ ██╔╝██╔══╝  ██╔══██╗╚██╗ ██╔╝██║██╔══╝  ██║███╗██║
-███████║   ██║   ███████║   ██║   ███████╗██║ ╚═╝ ██║    ╚██████╔╝ ╚████╔╝ ███████╗██║  ██║ ╚████╔╝ ██║███████╗╚███╔███╔╝
-╚══════╝   ╚═╝   ╚══════╝   ╚═╝   ╚══════╝╚═╝     ╚═╝     ╚═════╝   ╚═══╝  ╚══════╝╚═╝  ╚═╝  ╚═══╝  ╚═╝╚══════╝ ╚══╝╚══╝
-        """
-        return Text(header, style="bold bright_green")
-
-    def get_system_info(self) -> Panel:
-        """Get basic system information"""
-        uptime = time.time() - self.start_time
-        uptime_str = (
-            f"{int(uptime//3600):02d}:{int((uptime%3600)//60):02d}:{int(uptime%60):02d}"
-        )
+        self._create_panels()
 
-        info_table = Table(show_header=False, box=box.SIMPLE)
-        info_table.add_column("Property", style="bright_cyan")
-        info_table.add_column("Value", style="green")
+    def _init_gpus(self):
+        """Look up the GPU attributes that don't change between frames"""
+        for i in range(self.gpu_count):
+            try:
+                handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+                # Handle both string and bytes return types for GPU name
+                name_raw = pynvml.nvmlDeviceGetName(handle)
+            except Exception as e:
+                # Skip this GPU but keep the ones that do work
+                self._gpu_init_error = f"GPU {i}: {e}"
+                continue
+            if isinstance(name_raw, bytes):
+                name = name_raw.decode()
+            else:
+                name = str(name_raw)
 
-        info_table.add_row("🖥️  System", f"{platform.system()} {platform.machine()}")
-        info_table.add_row("🐍 Python", f"{platform.python_version()}")
-        info_table.add_row("⏱️  Uptime", uptime_str)
-        info_table.add_row(
-            "👤 User", psutil.users()[0].name if psutil.users() else "Unknown"
-        )
-        info_table.add_row("🕐 Time", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            try:
+                power_limit = (
+                    pynvml.nvmlDeviceGetPowerManagementLimitConstraints(handle)[1]
+                    // 1000
+                )  # Watts
+            except Exception:
+                power_limit = None
 
-        return Panel(
-            info_table,
-            title="[bold bright_cyan]System Info[/]",
-            border_style="bright_green",
-            box=box.SQUARE,
-        )
+            self._gpu_handles.append(handle)
+            self._gpu_names.append(
+                name.replace("NVIDIA ", "").replace("GeForce ", "")[:12]
+            )
+            self._gpu_power_limits.append(power_limit)
 
-    def get_cpu_memory_info(self) -> Panel:
-        """Get CPU and memory usage information"""
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        cpu_count = psutil.cpu_count()
-        cpu_freq = psutil.cpu_freq()
+    def _create_panels(self):
+        """Build every panel and its table columns once; frames refill rows"""
+        self._tables: Dict[str, Table] = {}
 
-        # Memory usage
-        memory = psutil.virtual_memory()
-        swap = psutil.swap_memory()
+        table = Table(show_header=False, box=box.SIMPLE)
+        table.add_column("Property", style="bright_cyan")
+        table.add_column("Value", style="green")
+        self._tables["system_info"] = table
 
         table = Table(show_header=False, box=box.SIMPLE)
         table.add_column("Metric", style="bright_cyan")
         table.add_column("Usage", style="green")
         table.add_column("Bar", style="yellow")
+        self._tables["cpu_mem"] = table
 
-        # CPU info
-        cpu_bar = "█" * int(cpu_percent // 5) + "░" * (20 - int(cpu_percent // 5))
-        table.add_row(
-            f"🔥 CPU ({cpu_count} cores)",
-            f"{cpu_percent:5.1f}%",
-            f"[{'red' if cpu_percent > 80 else 'yellow' if cpu_percent > 60 else 'green'}]{cpu_bar}[/]",
-        )
-
-        if cpu_freq:
-            table.add_row("⚡ CPU Freq", f"{cpu_freq.current:.0f} MHz", "")
-
-        # Memory info
-        mem_percent = memory.percent
-        mem_bar = "█" * int(mem_percent // 5) + "░" * (20 - int(mem_percent // 5))
-        table.add_row(
-            "💾 Memory",
-            f"{mem_percent:5.1f}%",
-            f"[{'red' if mem_percent > 80 else 'yellow' if mem_percent > 60 else 'green'}]{mem_bar}[/]",
-        )
-        table.add_row(
-            "",
-            f"{self.bytes_to_human(memory.used)} / {self.bytes_to_human(memory.total)}",
-            "",
-        )
+        table = Table(show_header=False, box=box.SIMPLE)
+        if self.gpu_count == 0:
+            # Nothing to refresh, so this table is filled in once here
+            table.add_column("Status", style="yellow")
+            table.add_row("🚫 No NVIDIA GPUs detected")
+        else:
+            table.add_column("GPU", style="bright_cyan", width=12)
+            table.add_column("Usage", style="green", width=8)
+            table.add_column("Memory", style="green", width=12)
+            table.add_column("Temp", style="green", width=8)
+            table.add_column("Power", style="green", width=10)
+        self._tables["gpu"] = table
 
-        # Swap info
-        if swap.total > 0:
-            swap_percent = swap.percent
-            swap_bar = "█" * int(swap_percent // 5) + "░" * (
-                20 - int(swap_percent // 5)
-            )
-            table.add_row(
-                "💿 Swap",
-                f"{swap_percent:5.1f}%",
-                f"[{'red' if swap_percent > 50 else 'yellow' if swap_percent > 20 else 'green'}]{swap_bar}[/]",
-            )
+        table = Table(show_header=False, box=box.SIMPLE)
+        table.add_column("Interface", style="bright_cyan")
+        table.add_column("Value", style="green")
+        self._tables["network"] = table
 
-        return Panel(
-            table,
-            title="[bold bright_cyan]CPU & Memory[/]",
-            border_style="bright_green",
-            box=box.SQUARE,
-        )
+        table = Table(show_header=True, box=box.SIMPLE)
+        table.add_column("PID", style="bright_cyan", width=8)
+        table.add_column("Process", style="green", width=20)
+        table.add_column("CPU%", style="yellow", width=8)
+        table.add_column("MEM%", style="magenta", width=8)
+        table.add_column("Status", style="blue", width=10)
+        self._tables["processes"] = table
 
-    def get_gpu_info(self) -> Panel:
-        """Get GPU information using nvidia-smi"""
-        if self.gpu_count == 0:
-            no_gpu_table = Table(show_header=False, box=box.SIMPLE)
-            no_gpu_table.add_column("Status", style="yellow")
-            no_gpu_table.add_row("🚫 No NVIDIA GPUs detected")
-            return Panel(
-                no_gpu_table,
-                title="[bold bright_cyan]GPU Status[/]",
+        table = Table(show_header=False, box=box.SIMPLE)
+        table.add_column("Disk", style="bright_cyan", width=15)
+        table.add_column("Usage", style="green", width=10)
+        table.add_column("Free/Total", style="green", width=15)
+        table.add_column("Bar", style="yellow", width=20)
+        self._tables["disk"] = table
+
+        titles = {
+            "system_info": "System Info",
+            "cpu_mem": "CPU & Memory",
+            "gpu": "GPU Status",
+            "network": "Network Traffic",
+            "processes": "Top Processes",
+            "disk": "Disk Usage",
+        }
+        self._panels: Dict[str, Panel] = {
+            name: Panel(
+                self._tables[name],
+                title=f"[bold bright_cyan]{title}[/]",
                 border_style="bright_green",
                 box=box.SQUARE,
             )
+            for name, title in titles.items()
+        }
+
+    def _reset_table(self, name: str) -> Table:
+        """Empty a panel's table so the current frame can add its rows"""
+        table = self._tables[name]
+        table.rows.clear()
+        for column in table.columns:
+            column._cells.clear()
+        return table
+
+    def _cached(self, key: str, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Return fn() reusing the previous result for up to ttl seconds"""
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        value = fn()
+        self._cache[key] = (now, value)
+        return value
+
+    def _collect(self) -> Snapshot:
+        """Gather every metric the dashboard shows; runs off the event loop"""
+        gpus, gpu_error = self._collect_gpus()
+        net_io, upload_speed, download_speed = self._collect_network()
+
+        return Snapshot(
+            users=self._cached("users", 10, psutil.users),
+            cpu_percent=psutil.cpu_percent(interval=None),
+            cpu_freq=self._cached("cpu_freq", 2, psutil.cpu_freq),
+            memory=psutil.virtual_memory(),
+            swap=psutil.swap_memory(),
+            gpus=gpus,
+            gpu_error=gpu_error,
+            net_io=net_io,
+            upload_speed=upload_speed,
+            download_speed=download_speed,
+            active_interfaces=self._cached(
+                "active_interfaces", 10, self._collect_active_interfaces
+            ),
+            processes=self._collect_processes(),
+            disks=self._collect_disks(),
+        )
 
-        table = Table(show_header=False, box=box.SIMPLE)
-        table.add_column("GPU", style="bright_cyan", width=12)
-        table.add_column("Usage", style="green", width=8)
-        table.add_column("Memory", style="green", width=12)
-        table.add_column("Temp", style="green", width=8)
-        table.add_column("Power", style="green", width=10)
-
+    def _collect_gpus(self) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Sample the per-frame NVML readings for every GPU"""
+        gpus = []
         try:
-            for i in range(self.gpu_count):
-                handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                # Handle both string and bytes return types for GPU name
-                name_raw = pynvml.nvmlDeviceGetName(handle)
-                if isinstance(name_raw, bytes):
-                    name = name_raw.decode()
-                else:
-                    name = str(name_raw)
-
+            for handle, gpu_name, power_limit in zip(
+                self._gpu_handles, self._gpu_names, self._gpu_power_limits
+            ):
                 # GPU utilization
                 util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-                gpu_util = int(util.gpu)
 
                 # Memory info
                 mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-                mem_used = int(mem_info.used) // 1024**2  # MB
-                mem_total = int(mem_info.total) // 1024**2  # MB
-                mem_percent = (mem_used / mem_total) * 100
 
                 # Temperature
                 try:
@@ -203,44 +383,32 @@ class SystemMonitor:
                 # Power
                 try:
                     power = pynvml.nvmlDeviceGetPowerUsage(handle) // 1000  # Watts
-                    power_limit = (
-                        pynvml.nvmlDeviceGetPowerManagementLimitConstraints(handle)[1]
-                        // 1000
-                    )
-                    power_str = f"{power}W/{power_limit}W"
                 except:
-                    power_str = "N/A"
-
-                gpu_name = name.replace("NVIDIA ", "").replace("GeForce ", "")[:12]
-                temp_color = "red" if temp > 80 else "yellow" if temp > 65 else "green"
-                util_color = (
-                    "red" if gpu_util > 90 else "yellow" if gpu_util > 70 else "green"
-                )
-
-                table.add_row(
-                    f"🎮 {gpu_name}",
-                    f"[{util_color}]{gpu_util}%[/]",
-                    f"{mem_used}MB/{mem_total}MB",
-                    f"[{temp_color}]{temp}°C[/]",
-                    power_str,
+                    power = None
+
+                gpus.append(
+                    {
+                        "name": gpu_name,
+                        "util": int(util.gpu),
+                        "mem_used": int(mem_info.used) // 1024**2,  # MB
+                        "mem_total": int(mem_info.total) // 1024**2,  # MB
+                        "temp": temp,
+                        "power": power,
+                        "power_limit": power_limit,
+                    }
                 )
         except Exception as e:
-            table.add_row("❌ Error", str(e)[:50], "", "", "")
+            return gpus, str(e)
+        return gpus, self._gpu_init_error
 
-        return Panel(
-            table,
-            title="[bold bright_cyan]GPU Status[/]",
-            border_style="bright_green",
-            box=box.SQUARE,
-        )
-
-    def get_network_info(self) -> Panel:
-        """Get network traffic information"""
+    def _collect_network(self) -> Tuple[Any, int, int]:
+        """Read network counters and the transfer rates since the last call"""
         current_stats = psutil.net_io_counters()
-        current_time = time.time()
-        time_delta = current_time - self.network_update_time
+        # Monotonic so clock adjustments can't produce bogus rates
+        current_ns = time.monotonic_ns()
+        time_delta_ns = current_ns - self.network_update_ns
 
-        if time_delta > 0:
+        if time_delta_ns > 0:
             bytes_sent_delta = (
                 current_stats.bytes_sent - self.network_stats_prev.bytes_sent
             )
@@ -248,126 +416,231 @@ class SystemMonitor:
                 current_stats.bytes_recv - self.network_stats_prev.bytes_recv
             )
 
-            upload_speed = bytes_sent_delta / time_delta
-            download_speed = bytes_recv_delta / time_delta
+            # Bytes per second, kept in integer arithmetic
+            upload_speed = bytes_sent_delta * 1_000_000_000 // time_delta_ns
+            download_speed = bytes_recv_delta * 1_000_000_000 // time_delta_ns
         else:
             upload_speed = download_speed = 0
 
         self.network_stats_prev = current_stats
-        self.network_update_time = current_time
+        self.network_update_ns = current_ns
 
-        table = Table(show_header=False, box=box.SIMPLE)
-        table.add_column("Interface", style="bright_cyan")
-        table.add_column("Value", style="green")
-
-        table.add_row("📡 Upload Speed", f"{self.bytes_to_human(upload_speed)}/s")
-        table.add_row("📥 Download Speed", f"{self.bytes_to_human(download_speed)}/s")
-        table.add_row("📤 Total Sent", self.bytes_to_human(current_stats.bytes_sent))
-        table.add_row(
-            "📨 Total Received", self.bytes_to_human(current_stats.bytes_recv)
-        )
-        table.add_row("📊 Packets Sent", f"{current_stats.packets_sent:,}")
-        table.add_row("📊 Packets Received", f"{current_stats.packets_recv:,}")
+        return current_stats, upload_speed, download_speed
 
-        # Get active network interfaces
+    @staticmethod
+    def _collect_active_interfaces() -> List[str]:
+        """Names of the first few network interfaces that are up"""
         interfaces = psutil.net_if_stats()
-        active_interfaces = [name for name, stats in interfaces.items() if stats.isup]
-        table.add_row("🌐 Active Interfaces", ", ".join(active_interfaces[:3]))
-
-        return Panel(
-            table,
-            title="[bold bright_cyan]Network Traffic[/]",
-            border_style="bright_green",
-            box=box.SQUARE,
-        )
+        return [name for name, stats in interfaces.items() if stats.isup][:3]
+
+    def _collect_processes(self) -> List[Dict[str, Any]]:
+        """Get the top processes by CPU usage"""
+
+        def cpu_samples():
+            # process_iter() reuses its cached, pid-reuse-checked Process
+            # objects, so cpu_percent() diffs against the previous frame
+            for proc in psutil.process_iter():
+                try:
+                    cpu = proc.cpu_percent(interval=None)
+                except psutil.NoSuchProcess:
+                    continue
+                except psutil.AccessDenied:
+                    cpu = 0.0
+                yield cpu, proc
+
+        # Top 10 processes by CPU usage; only these get their other
+        # attributes read
+        top = heapq.nlargest(10, cpu_samples(), key=lambda sample: sample[0])
 
-    def get_top_processes(self) -> Panel:
-        """Get top processes by CPU usage"""
         processes = []
-        for proc in psutil.process_iter(
-            ["pid", "name", "cpu_percent", "memory_percent", "status"]
-        ):
+        for cpu, proc in top:
             try:
-                processes.append(proc.info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+                # as_dict() reads all attributes inside a single oneshot()
+                info = proc.as_dict(
+                    ["pid", "name", "memory_percent", "status"], ad_value=None
+                )
+            except psutil.NoSuchProcess:
+                continue
+            info["cpu_percent"] = cpu
+            processes.append(info)
+        return processes
+
+    def _collect_disks(self) -> List[Tuple[str, Any]]:
+        """Get (device, usage) for the first few mounted partitions"""
+        disks = []
+        disk_partitions = self._cached("disk_partitions", 60, self._collect_partitions)
+        for partition in disk_partitions[:5]:  # Show top 5 partitions
+            try:
+                disks.append(
+                    (partition.device, psutil.disk_usage(partition.mountpoint))
+                )
+            except PermissionError:
+                continue
+        return disks
 
-        # Sort by CPU usage
-        processes.sort(key=lambda x: x["cpu_percent"] or 0, reverse=True)
+    @staticmethod
+    def _collect_partitions() -> List[Any]:
+        """List mounted partitions, skipping pseudo and media-less drives"""
+        return [
+            partition
+            for partition in psutil.disk_partitions()
+            if partition.fstype and partition.fstype not in _SKIP_FS
+        ]
+
+    def _clock(self, now: float) -> str:
+        """Format the wall clock, reusing the string within the same second"""
+        second = int(now)
+        if second != self._clock_second:
+            self._clock_second = second
+            self._clock_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        return self._clock_str
+
+    def _render_system_info(self, snap: Snapshot) -> Panel:
+        """Render basic system information"""
+        now = time.time()
+        uptime = now - self.start_time
+        uptime_str = (
+            f"{int(uptime//3600):02d}:{int((uptime%3600)//60):02d}:{int(uptime%60):02d}"
+        )
 
-        table = Table(show_header=True, box=box.SIMPLE)
-        table.add_column("PID", style="bright_cyan", width=8)
-        table.add_column("Process", style="green", width=20)
-        table.add_column("CPU%", style="yellow", width=8)
-        table.add_column("MEM%", style="magenta", width=8)
-        table.add_column("Status", style="blue", width=10)
+        info_table = self._reset_table("system_info")
+
+        info_table.add_row("🖥️  System", self.system_str)
+        info_table.add_row("🐍 Python", self.python_version)
+        info_table.add_row("⏱️  Uptime", uptime_str)
+        info_table.add_row("👤 User", snap.users[0].name if snap.users else "Unknown")
+        info_table.add_row("🕐 Time", self._clock(now))
+
+        return self._panels["system_info"]
+
+    def _render_cpu_memory(self, snap: Snapshot) -> Panel:
+        """Render CPU and memory usage information"""
+        cpu_percent = snap.cpu_percent
+        cpu_count = self.cpu_count
+        cpu_freq = snap.cpu_freq
+        memory = snap.memory
+        swap = snap.swap
+
+        table = self._reset_table("cpu_mem")
+
+        # CPU info
+        table.add_row(
+            f"🔥 CPU ({cpu_count} cores)",
+            _FMT_PCT(cpu_percent),
+            _bar_markup(_CPU_BARS, cpu_percent),
+        )
+
+        if cpu_freq:
+            table.add_row("⚡ CPU Freq", _FMT_MHZ(cpu_freq.current), "")
 
-        for proc in processes[:10]:  # Top 10 processes
-            cpu_color = (
-                "red"
-                if (proc["cpu_percent"] or 0) > 50
-                else "yellow" if (proc["cpu_percent"] or 0) > 20 else "white"
+        # Memory info
+        mem_percent = memory.percent
+        table.add_row(
+            "💾 Memory",
+            _FMT_PCT(mem_percent),
+            _bar_markup(_MEM_BARS, mem_percent),
+        )
+        table.add_row(
+            "",
+            f"{self.bytes_to_human(memory.used)} / {self.bytes_to_human(memory.total)}",
+            "",
+        )
+
+        # Swap info
+        if swap.total > 0:
+            swap_percent = swap.percent
+            table.add_row(
+                "💿 Swap",
+                _FMT_PCT(swap_percent),
+                _bar_markup(_SWAP_BARS, swap_percent),
             )
-            mem_color = (
-                "red"
-                if (proc["memory_percent"] or 0) > 20
-                else "yellow" if (proc["memory_percent"] or 0) > 10 else "white"
+
+        return self._panels["cpu_mem"]
+
+    def _render_gpu(self, snap: Snapshot) -> Panel:
+        """Render GPU information from NVML"""
+        if self.gpu_count == 0:
+            return self._panels["gpu"]
+
+        table = self._reset_table("gpu")
+
+        for gpu in snap.gpus:
+            gpu_util = gpu["util"]
+            temp = gpu["temp"]
+            if gpu["power"] is not None and gpu["power_limit"] is not None:
+                power_str = f"{gpu['power']}W/{gpu['power_limit']}W"
+            else:
+                power_str = "N/A"
+
+            temp_color = "red" if temp > 80 else "yellow" if temp > 65 else "green"
+            util_color = (
+                "red" if gpu_util > 90 else "yellow" if gpu_util > 70 else "green"
             )
 
             table.add_row(
-                str(proc["pid"]),
-                (proc["name"] or "N/A")[:20],
-                f"[{cpu_color}]{proc['cpu_percent'] or 0:.1f}[/]",
-                f"[{mem_color}]{proc['memory_percent'] or 0:.1f}[/]",
-                (proc["status"] or "N/A")[:10],
+                f"🎮 {gpu['name']}",
+                f"[{util_color}]{gpu_util}%[/]",
+                f"{gpu['mem_used']}MB/{gpu['mem_total']}MB",
+                f"[{temp_color}]{temp}°C[/]",
+                power_str,
             )
+        if snap.gpu_error is not None:
+            table.add_row("❌ Error", snap.gpu_error[:50], "", "", "")
 
-        return Panel(
-            table,
-            title="[bold bright_cyan]Top Processes[/]",
-            border_style="bright_green",
-            box=box.SQUARE,
-        )
+        return self._panels["gpu"]
 
-    def get_disk_usage(self) -> Panel:
-        """Get disk usage information"""
-        table = Table(show_header=False, box=box.SIMPLE)
-        table.add_column("Disk", style="bright_cyan", width=15)
-        table.add_column("Usage", style="green", width=10)
-        table.add_column("Free/Total", style="green", width=15)
-        table.add_column("Bar", style="yellow", width=20)
+    def _render_network(self, snap: Snapshot) -> Panel:
+        """Render network traffic information"""
+        net_io = snap.net_io
 
-        disk_partitions = psutil.disk_partitions()
-        for partition in disk_partitions[:5]:  # Show top 5 partitions
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                percent = (usage.used / usage.total) * 100
-                disk_bar = "█" * int(percent // 5) + "░" * (20 - int(percent // 5))
-
-                table.add_row(
-                    f"💽 {partition.device}",
-                    f"{percent:.1f}%",
-                    f"{self.bytes_to_human(usage.free)} / {self.bytes_to_human(usage.total)}",
-                    f"[{'red' if percent > 90 else 'yellow' if percent > 75 else 'green'}]{disk_bar}[/]",
-                )
-            except PermissionError:
-                continue
+        table = self._reset_table("network")
 
-        return Panel(
-            table,
-            title="[bold bright_cyan]Disk Usage[/]",
-            border_style="bright_green",
-            box=box.SQUARE,
+        table.add_row("📡 Upload Speed", f"{self.bytes_to_human(snap.upload_speed)}/s")
+        table.add_row(
+            "📥 Download Speed", f"{self.bytes_to_human(snap.download_speed)}/s"
         )
+        table.add_row("📤 Total Sent", self.bytes_to_human(net_io.bytes_sent))
+        table.add_row("📨 Total Received", self.bytes_to_human(net_io.bytes_recv))
+        table.add_row("📊 Packets Sent", _FMT_COMMA(net_io.packets_sent))
+        table.add_row("📊 Packets Received", _FMT_COMMA(net_io.packets_recv))
+        table.add_row("🌐 Active Interfaces", ", ".join(snap.active_interfaces))
+
+        return self._panels["network"]
+
+    def _render_processes(self, snap: Snapshot) -> Panel:
+        """Render the top processes by CPU usage"""
+        table = self._reset_table("processes")
+
+        for proc in snap.processes:
+            table.add_row(*_fmt_proc_row(proc))
+
+        return self._panels["processes"]
+
+    def _render_disks(self, snap: Snapshot) -> Panel:
+        """Render disk usage information"""
+        table = self._reset_table("disk")
+
+        for device, usage in snap.disks:
+            percent = (usage.used / usage.total) * 100
+
+            table.add_row(
+                f"💽 {device}",
+                f"{percent:.1f}%",
+                f"{self.bytes_to_human(usage.free)} / {self.bytes_to_human(usage.total)}",
+                _bar_markup(_DISK_BARS, percent),
+            )
+
+        return self._panels["disk"]
 
     @staticmethod
     def bytes_to_human(bytes_val: float) -> str:
         """Convert bytes to human readable format"""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if bytes_val < 1024.0:
-                return f"{bytes_val:.1f}{unit}"
-            bytes_val /= 1024.0
-        return f"{bytes_val:.1f}PB"
+        if bytes_val < 1024:
+            return f"{bytes_val:.1f}B"
+        value = int(bytes_val)
+        # Each unit is 2**10 of the previous, so the bit length picks it
+        exp = min((value.bit_length() - 1) // 10, 5)
+        return f"{value / (1 << (exp * 10)):.1f}{_BYTE_UNITS[exp]}"
 
     def create_layout(self) -> Layout:
         """Create the main layout"""
@@ -393,44 +666,72 @@ class SystemMonitor:
             Layout(name="disk", ratio=1),
         )
 
+        # Header and footer never change, so they're only set once
+        layout["header"].update(self._header_panel)
+        layout["footer"].update(self._footer_panel)
+
+        # Until the first snapshot is collected, show each panel with a
+        # placeholder row (the no-GPU panel is already complete)
+        for name, panel in self._panels.items():
+            table = self._tables[name]
+            if not table.row_count:
+                table.add_row("⏳ Collecting...")
+            layout[name].update(panel)
+
         return layout
 
-    def update_layout(self, layout: Layout):
-        """Update all panels in the layout"""
-        layout["header"].update(Align.center(self.get_ascii_header()))
-        layout["system_info"].update(self.get_system_info())
-        layout["cpu_mem"].update(self.get_cpu_memory_info())
-        layout["gpu"].update(self.get_gpu_info())
-        layout["network"].update(self.get_network_info())
-        layout["processes"].update(self.get_top_processes())
-        layout["disk"].update(self.get_disk_usage())
-
-        footer_text = Text(
-            "🚀 System Overview - Press Ctrl+C to exit 🚀", style="bold bright_green"
-        )
-        layout["footer"].update(Align.center(footer_text))
+    def update_layout(self, layout: Layout, snap: Snapshot):
+        """Update all panels in the layout from a collected snapshot"""
+        layout["system_info"].update(self._render_system_info(snap))
+        layout["cpu_mem"].update(self._render_cpu_memory(snap))
+        layout["network"].update(self._render_network(snap))
+        layout["processes"].update(self._render_processes(snap))
+        layout["gpu"].update(self._render_gpu(snap))
+        layout["disk"].update(self._render_disks(snap))
 
     async def run(self):
         """Main run loop"""
         layout = self.create_layout()
-
-        with Live(layout, refresh_per_second=2, screen=True) as live:
+        loop = asyncio.get_running_loop()
+
+        # Redraw only after fresh data lands instead of on Rich's own timer,
+        # and schedule each tick from a fixed start so wakeups don't drift
+        with Live(
+            layout, refresh_per_second=1, screen=True, auto_refresh=False
+        ) as live:
+            next_tick = time.monotonic()
             while True:
                 try:
-                    self.update_layout(layout)
-                    await asyncio.sleep(1)
+                    # psutil/NVML calls run in a worker thread so they never
+                    # block the event loop
+                    snap = await loop.run_in_executor(None, self._collect)
+                    self.update_layout(layout, snap)
+                    live.refresh()
                 except KeyboardInterrupt:
                     break
                 except Exception as e:
                     self.console.print(f"[red]Error: {e}[/red]")
-                    await asyncio.sleep(1)
+
+                next_tick += REFRESH_INTERVAL
+                now = time.monotonic()
+                if next_tick < now:
+                    # Fell behind (slow frame or suspend), don't try to catch up
+                    next_tick = now
+                await asyncio.sleep(next_tick - now)
 
 
 def main():
     """Main entry point"""
     try:
         monitor = SystemMonitor()
-        asyncio.run(monitor.run())
+        # uvloop is a faster drop-in event loop (not available on Windows)
+        if UVLOOP_AVAILABLE and sys.version_info >= (3, 11):
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(monitor.run())
+        else:
+            if UVLOOP_AVAILABLE:
+                uvloop.install()
+            asyncio.run(monitor.run())
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
     except Exception as e: